@@ -0,0 +1,39 @@
+"""indice cubriente para login
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY no puede ejecutarse dentro de una transacción
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_estudiantes_login',
+            'estudiantes',
+            ['correo_institucional'],
+            unique=False,
+            postgresql_include=['id', 'contrasena_hash'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_estudiantes_login',
+            table_name='estudiantes',
+            postgresql_concurrently=True,
+        )
@@ -1,29 +1,27 @@
 from fastapi import FastAPI, HTTPException, Depends, status, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from datetime import timedelta
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 import logging
 
 from core.config import settings
-from core.database import get_db, engine, Base
+from core.database import get_db, DBSessionMiddleware
 from schemas.estudiante import EstudianteCreate, EstudianteResponse, LoginRequest, Token
 from services.auth_service import (
     create_estudiante,
     authenticate_estudiante,
     create_access_token,
-    get_estudiante_by_correo,
-    get_estudiante_by_dni
+    estudiante_correo_exists
 )
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Crear las tablas en la base de datos
-Base.metadata.create_all(bind=engine)
-
 # Inicializar la aplicación FastAPI
 app = FastAPI(
     title=settings.APP_NAME,
@@ -34,11 +32,11 @@ app = FastAPI(
 # Manejador de errores de validación
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    logger.error(f"Error de validación: {exc.errors()}")
+    logger.error("Error de validación: %s", exc.errors())
     return JSONResponse(
         status_code=422,
         content={
-            "detail": exc.errors(),
+            "detail": jsonable_encoder(exc.errors()),
             "body": str(exc.body) if hasattr(exc, 'body') else None
         }
     )
@@ -46,12 +44,22 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 # Configurar CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # En producción, especificar los orígenes permitidos
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
+# Una sesión de base de datos por petición, cerrada al terminar
+app.add_middleware(DBSessionMiddleware)
+
+
+def _constraint_name(exc: IntegrityError) -> Optional[str]:
+    """Obtiene el nombre de la restricción violada, si el driver lo informa"""
+    # asyncpg expone la excepción original como causa del error adaptado
+    return getattr(exc.orig.__cause__, "constraint_name", None)
+
 
 @app.get("/")
 def read_root():
@@ -82,7 +90,7 @@ def health_check():
 )
 async def registrar_estudiante(
     estudiante: EstudianteCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Registra un nuevo estudiante en el sistema
@@ -97,32 +105,34 @@ async def registrar_estudiante(
     Raises:
         HTTPException: Si el correo o DNI ya están registrados
     """
-    logger.info(f"Intentando registrar estudiante: {estudiante.correo_institucional}")
-    logger.info(f"Datos recibidos: nombres={estudiante.nombres}, apellidos={estudiante.apellidos}, dni={estudiante.dni}")
-    
-    # Verificar si el correo ya existe
-    existing_correo = get_estudiante_by_correo(db, estudiante.correo_institucional)
-    if existing_correo:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="El correo institucional ya está registrado"
-        )
+    logger.info("Intentando registrar estudiante: %s", estudiante.correo_institucional)
+    logger.info(
+        "Datos recibidos: nombres=%s, apellidos=%s, dni=%s",
+        estudiante.nombres, estudiante.apellidos, estudiante.dni
+    )
     
-    # Verificar si el DNI ya existe
-    existing_dni = get_estudiante_by_dni(db, estudiante.dni)
-    if existing_dni:
+    # Crear el estudiante; los índices UNIQUE de correo y DNI rechazan duplicados
+    try:
+        db_estudiante = await create_estudiante(db, estudiante)
+        logger.info("Estudiante registrado exitosamente: %s", estudiante.correo_institucional)
+        return db_estudiante
+    except IntegrityError as e:
+        await db.rollback()
+        constraint = _constraint_name(e)
+        if constraint is not None:
+            correo_duplicado = "correo_institucional" in constraint
+        else:
+            correo_duplicado = await estudiante_correo_exists(db, estudiante.correo_institucional)
+        if correo_duplicado:
+            detail = "El correo institucional ya está registrado"
+        else:
+            detail = "El DNI ya está registrado"
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="El DNI ya está registrado"
+            detail=detail
         )
-    
-    # Crear el estudiante
-    try:
-        db_estudiante = create_estudiante(db, estudiante)
-        logger.info(f"Estudiante registrado exitosamente: {estudiante.correo_institucional}")
-        return db_estudiante
     except Exception as e:
-        logger.error(f"Error al registrar estudiante: {str(e)}")
+        logger.error("Error al registrar estudiante: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error al registrar el estudiante: {str(e)}"
@@ -135,9 +145,9 @@ async def registrar_estudiante(
     summary="Iniciar sesión",
     description="Autentica a un estudiante y retorna un token JWT"
 )
-def login(
+async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Autentica a un estudiante y genera un token JWT
@@ -153,7 +163,7 @@ def login(
         HTTPException: Si las credenciales son inválidas
     """
     # Autenticar al estudiante
-    estudiante = authenticate_estudiante(
+    estudiante = await authenticate_estudiante(
         db,
         login_data.correo_institucional,
         login_data.contrasena
@@ -166,11 +176,9 @@ def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Crear el token de acceso
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Crear el token de acceso (expira según ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": estudiante.correo_institucional},
-        expires_delta=access_token_expires
+        data={"sub": estudiante.correo_institucional}
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
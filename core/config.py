@@ -1,5 +1,6 @@
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -7,6 +8,10 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    DB_QUERY_CACHE_SIZE: int = 1200
     
     # JWT
     SECRET_KEY: str
@@ -17,6 +22,18 @@ class Settings(BaseSettings):
     APP_NAME: str = "PAPPI Calculator Auth API"
     DEBUG: bool = False
     
+    # CORS: sin orígenes por defecto; deben listarse explícitamente
+    CORS_ORIGINS: List[str] = []
+    CORS_MAX_AGE: int = 600
+    
+    @field_validator('CORS_ORIGINS')
+    @classmethod
+    def validar_cors_origins(cls, v):
+        """Rechazar el comodín, incompatible con allow_credentials"""
+        if "*" in v:
+            raise ValueError('CORS_ORIGINS no admite "*" porque CORS permite credenciales; lista los orígenes explícitamente')
+        return v
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,26 +1,83 @@
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from starlette.types import ASGIApp, Receive, Scope, Send
 from core.config import settings
 
-# Crear el engine de SQLAlchemy
-engine = create_engine(
-    settings.DATABASE_URL,
+
+def _async_database_url(database_url: str) -> URL:
+    """Usa el driver asyncpg para las URLs de PostgreSQL (Alembic sigue usando psycopg2)"""
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+# Crear el engine asíncrono de SQLAlchemy
+engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
     echo=settings.DEBUG
 )
 
-# Crear la sesión de base de datos
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Crear la sesión de base de datos; sin expirar tras commit para no
+# disparar cargas perezosas (no permitidas con AsyncSession)
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base para los modelos
 Base = declarative_base()
 
+# Sesión de la petición en curso, compartida por todo lo que acceda a la base de datos
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar("db_session", default=None)
+
+
+def get_request_session() -> AsyncSession:
+    """Obtiene la sesión de la petición actual, creándola en el primer uso"""
+    session = _request_session.get()
+    if session is None:
+        session = SessionLocal()
+        _request_session.set(session)
+    return session
+
+
+async def close_request_session() -> None:
+    """Cierra la sesión de la petición actual, si se llegó a crear"""
+    session = _request_session.get()
+    if session is not None:
+        _request_session.set(None)
+        await session.close()
+
+
+async def get_db():
+    """Dependencia para obtener la sesión de base de datos de la petición"""
+    yield get_request_session()
+
+
+class DBSessionMiddleware:
+    """Middleware ASGI que cierra la sesión de base de datos al terminar cada petición"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-def get_db():
-    """Dependencia para obtener la sesión de base de datos"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+        token = _request_session.set(None)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await close_request_session()
+            _request_session.reset(token)
@@ -0,0 +1,30 @@
+# Configuración de Gunicorn para producción
+import multiprocessing
+import os
+
+# Dirección y puerto de escucha
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+
+# Workers ASGI de Uvicorn; ver "Producción" en el README (presupuesto de conexiones)
+_MAX_WORKERS = 4
+workers = int(os.environ.get(
+    "WEB_CONCURRENCY",
+    min(multiprocessing.cpu_count() * 2 + 1, _MAX_WORKERS)
+))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Importar la aplicación una sola vez en el proceso maestro antes de crear los
+# workers: comparten por copy-on-write los modelos, schemas y configuración ya
+# cargados. El engine no abre conexiones al importarse, así que cada worker
+# crea las suyas tras el fork.
+preload_app = True
+
+# Tiempos de espera
+timeout = int(os.environ.get("TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("KEEP_ALIVE", 5))
+
+# Logging
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Index, Integer, String, DateTime
 from sqlalchemy.sql import func
 from core.database import Base
 
@@ -7,6 +7,14 @@ class Estudiante(Base):
     """Modelo de estudiante para el sistema de autenticación"""
     
     __tablename__ = "estudiantes"
+    __table_args__ = (
+        # Índice cubriente para el login (permite index-only scans en PostgreSQL)
+        Index(
+            "ix_estudiantes_login",
+            "correo_institucional",
+            postgresql_include=["id", "contrasena_hash"]
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     nombres = Column(String(100), nullable=False)
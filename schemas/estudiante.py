@@ -1,7 +1,7 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic_core import PydanticCustomError
 from datetime import datetime
 from typing import Optional
-import re
 
 
 class EstudianteBase(BaseModel):
@@ -25,14 +25,6 @@ class EstudianteCreate(EstudianteBase):
         if len(v) < 7 or len(v) > 20:
             raise ValueError('El DNI debe tener entre 7 y 20 dígitos')
         return v
-    
-    @field_validator('contrasena')
-    @classmethod
-    def validar_contrasena(cls, v):
-        """Validar requisitos mínimos de la contraseña"""
-        if len(v) < 6:
-            raise ValueError('La contraseña debe tener al menos 6 caracteres')
-        return v
 
 
 class EstudianteResponse(EstudianteBase):
@@ -47,8 +39,18 @@ class EstudianteResponse(EstudianteBase):
 
 class LoginRequest(BaseModel):
     """Schema para solicitud de login"""
-    correo_institucional: EmailStr
+    correo_institucional: str
     contrasena: str
+    
+    @field_validator('correo_institucional')
+    @classmethod
+    def validar_correo(cls, v):
+        """Validación ligera del correo; el login solo busca cuentas ya registradas"""
+        local, _, dominio = v.strip().partition('@')
+        if not local or '.' not in dominio:
+            raise PydanticCustomError('value_error', 'El correo institucional no es válido')
+        # Igual que EmailStr, normalizar el dominio a minúsculas
+        return f"{local}@{dominio.lower()}"
 
 
 class Token(BaseModel):
@@ -1,19 +1,42 @@
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from datetime import timedelta
+from typing import Dict, List, Optional
+import time
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
+import jwt
+from sqlalchemy import exists, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from core.config import settings
 from models.estudiante import Estudiante
 from schemas.estudiante import EstudianteCreate, TokenData
 
 # Configuración de hashing de contraseñas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2 para hashes nuevos; bcrypt se mantiene para verificar hashes existentes
+password_hasher = PasswordHasher()
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Caché de credenciales para login: correo -> fila (id, correo_institucional, contrasena_hash).
+# Se guardan filas de columnas, no objetos ORM, para no depender de la sesión.
+# La caché es por proceso: invalidar_credenciales solo limpia la del worker actual,
+# así que el TTL es el único límite de consistencia entre workers. Un futuro
+# endpoint de cambio de contraseña debe tenerlo en cuenta (el hash anterior sigue
+# aceptándose hasta 30 s en los demás workers).
+_credenciales_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+# Parámetros JWT preparados una sola vez al importar el módulo
+_SIGNING_KEY = settings.SECRET_KEY.encode("utf-8")
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [settings.ALGORITHM]
+_DEFAULT_EXPIRES_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
 
 def hash_password(password: str) -> str:
     """
-    Hashea una contraseña usando bcrypt
+    Hashea una contraseña usando argon2
     
     Args:
         password: Contraseña en texto plano
@@ -21,9 +44,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hash de la contraseña
     """
-    # Bcrypt tiene un límite de 72 bytes, truncamos por seguridad
-    password_truncated = password[:72]
-    return pwd_context.hash(password_truncated)
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -37,7 +58,28 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True si la contraseña coincide, False en caso contrario
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        if hashed_password.startswith(_BCRYPT_PREFIXES):
+            # Bcrypt solo considera los primeros 72 bytes
+            return bcrypt.checkpw(plain_password.encode("utf-8")[:72], hashed_password.encode("utf-8"))
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError, ValueError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Indica si un hash debe regenerarse (bcrypt heredado o parámetros argon2 desactualizados)
+    
+    Args:
+        hashed_password: Hash de la contraseña
+        
+    Returns:
+        True si el hash debe regenerarse, False en caso contrario
+    """
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    return password_hasher.check_needs_rehash(hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -52,13 +94,11 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         Token JWT codificado
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expires_in = int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_EXPIRES_SECONDS
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    # "exp" como segundos desde epoch (UTC), sin construir datetimes
+    to_encode["exp"] = int(time.time()) + expires_in
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
@@ -73,44 +113,99 @@ def decode_access_token(token: str) -> Optional[TokenData]:
         TokenData con la información del usuario o None si el token es inválido
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
         correo_institucional: str = payload.get("sub")
         if correo_institucional is None:
             return None
         return TokenData(correo_institucional=correo_institucional)
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
-def authenticate_estudiante(db: Session, correo_institucional: str, contrasena: str) -> Optional[Estudiante]:
+async def get_credenciales(db: AsyncSession, correo_institucional: str) -> Optional[Row]:
+    """
+    Obtiene las credenciales de un estudiante, usando la caché de login
+    
+    Args:
+        db: Sesión de base de datos
+        correo_institucional: Correo institucional del estudiante
+        
+    Returns:
+        Fila (id, correo_institucional, contrasena_hash) si existe, None en caso contrario
+    """
+    credenciales = _credenciales_cache.get(correo_institucional)
+    if credenciales is not None:
+        return credenciales
+    
+    result = await db.execute(
+        select(
+            Estudiante.id,
+            Estudiante.correo_institucional,
+            Estudiante.contrasena_hash
+        ).where(Estudiante.correo_institucional == correo_institucional)
+    )
+    credenciales = result.first()
+    
+    if credenciales is not None:
+        _credenciales_cache[correo_institucional] = credenciales
+    return credenciales
+
+
+def invalidar_credenciales(correo_institucional: str) -> None:
+    """
+    Elimina de la caché de login las credenciales de un estudiante
+    
+    Args:
+        correo_institucional: Correo institucional del estudiante
+    """
+    _credenciales_cache.pop(correo_institucional, None)
+
+
+async def authenticate_estudiante(db: AsyncSession, correo_institucional: str, contrasena: str) -> Optional[Row]:
     """
     Autentica un estudiante verificando sus credenciales
     
+    La verificación del hash se ejecuta en el threadpool para no bloquear
+    el event loop.
+    
     Args:
         db: Sesión de base de datos
         correo_institucional: Correo institucional del estudiante
         contrasena: Contraseña en texto plano
         
     Returns:
-        Objeto Estudiante si las credenciales son válidas, None en caso contrario
+        Fila (id, correo_institucional, contrasena_hash) si las credenciales son válidas,
+        None en caso contrario
     """
-    estudiante = db.query(Estudiante).filter(
-        Estudiante.correo_institucional == correo_institucional
-    ).first()
+    estudiante = await get_credenciales(db, correo_institucional)
     
     if not estudiante:
         return None
     
-    if not verify_password(contrasena, estudiante.contrasena_hash):
+    if not await run_in_threadpool(verify_password, contrasena, estudiante.contrasena_hash):
         return None
     
+    # Migrar hashes bcrypt heredados a argon2 tras un login exitoso
+    if password_needs_rehash(estudiante.contrasena_hash):
+        nuevo_hash = await run_in_threadpool(hash_password, contrasena)
+        await db.execute(
+            update(Estudiante)
+            .where(Estudiante.id == estudiante.id)
+            .values(contrasena_hash=nuevo_hash)
+        )
+        await db.commit()
+        invalidar_credenciales(correo_institucional)
+    
     return estudiante
 
 
-def create_estudiante(db: Session, estudiante_data: EstudianteCreate) -> Estudiante:
+async def create_estudiante(db: AsyncSession, estudiante_data: EstudianteCreate) -> Estudiante:
     """
     Crea un nuevo estudiante en la base de datos
     
+    El hash de la contraseña se calcula en el threadpool para no bloquear
+    el event loop.
+    
     Args:
         db: Sesión de base de datos
         estudiante_data: Datos del estudiante a crear
@@ -118,7 +213,7 @@ def create_estudiante(db: Session, estudiante_data: EstudianteCreate) -> Estudia
     Returns:
         Objeto Estudiante creado
     """
-    hashed_password = hash_password(estudiante_data.contrasena)
+    hashed_password = await run_in_threadpool(hash_password, estudiante_data.contrasena)
     
     db_estudiante = Estudiante(
         nombres=estudiante_data.nombres,
@@ -128,14 +223,14 @@ def create_estudiante(db: Session, estudiante_data: EstudianteCreate) -> Estudia
         contrasena_hash=hashed_password
     )
     
+    # El INSERT usa RETURNING para traer id y created_at; no hace falta refresh
     db.add(db_estudiante)
-    db.commit()
-    db.refresh(db_estudiante)
+    await db.commit()
     
     return db_estudiante
 
 
-def get_estudiante_by_correo(db: Session, correo_institucional: str) -> Optional[Estudiante]:
+async def get_estudiante_by_correo(db: AsyncSession, correo_institucional: str) -> Optional[Estudiante]:
     """
     Obtiene un estudiante por su correo institucional
     
@@ -146,12 +241,33 @@ def get_estudiante_by_correo(db: Session, correo_institucional: str) -> Optional
     Returns:
         Objeto Estudiante si existe, None en caso contrario
     """
-    return db.query(Estudiante).filter(
-        Estudiante.correo_institucional == correo_institucional
-    ).first()
+    result = await db.execute(
+        select(Estudiante).where(Estudiante.correo_institucional == correo_institucional)
+    )
+    return result.scalar_one_or_none()
 
 
-def get_estudiante_by_dni(db: Session, dni: str) -> Optional[Estudiante]:
+async def get_estudiantes_by_correos(db: AsyncSession, correos: List[str]) -> Dict[str, Estudiante]:
+    """
+    Obtiene varios estudiantes por sus correos institucionales en una sola consulta
+    
+    Args:
+        db: Sesión de base de datos
+        correos: Correos institucionales a buscar
+        
+    Returns:
+        Diccionario correo -> Estudiante con los correos que existen
+    """
+    if not correos:
+        return {}
+    
+    result = await db.execute(
+        select(Estudiante).where(Estudiante.correo_institucional.in_(correos))
+    )
+    return {e.correo_institucional: e for e in result.scalars()}
+
+
+async def get_estudiante_by_dni(db: AsyncSession, dni: str) -> Optional[Estudiante]:
     """
     Obtiene un estudiante por su DNI
     
@@ -162,4 +278,23 @@ def get_estudiante_by_dni(db: Session, dni: str) -> Optional[Estudiante]:
     Returns:
         Objeto Estudiante si existe, None en caso contrario
     """
-    return db.query(Estudiante).filter(Estudiante.dni == dni).first()
+    result = await db.execute(select(Estudiante).where(Estudiante.dni == dni))
+    return result.scalar_one_or_none()
+
+
+async def estudiante_correo_exists(db: AsyncSession, correo_institucional: str) -> bool:
+    """
+    Verifica si un correo institucional ya está registrado
+    
+    Emite un SELECT EXISTS(...), sin cargar el estudiante.
+    
+    Args:
+        db: Sesión de base de datos
+        correo_institucional: Correo institucional a verificar
+        
+    Returns:
+        True si el correo ya está registrado, False en caso contrario
+    """
+    return await db.scalar(
+        select(exists().where(Estudiante.correo_institucional == correo_institucional))
+    )
@@ -0,0 +1,19 @@
+import pytest
+from pydantic import ValidationError
+
+from core.config import Settings
+
+
+def test_cors_origins_por_defecto_vacio():
+    settings = Settings(_env_file=None, DATABASE_URL="postgresql://test@localhost/test", SECRET_KEY="clave")
+    assert settings.CORS_ORIGINS == []
+
+
+def test_cors_origins_rechaza_comodin():
+    with pytest.raises(ValidationError):
+        Settings(
+            _env_file=None,
+            DATABASE_URL="postgresql://test@localhost/test",
+            SECRET_KEY="clave",
+            CORS_ORIGINS=["https://pappi.universidad.edu.pe", "*"]
+        )
@@ -0,0 +1,80 @@
+import asyncio
+
+import bcrypt
+from sqlalchemy import select
+
+from models.estudiante import Estudiante
+from services.auth_service import hash_password
+
+CORREO = "juan.perez@universidad.edu.pe"
+CONTRASENA = "Password123"
+
+
+def _crear_estudiante(sesiones, contrasena_hash: str) -> None:
+    async def crear():
+        async with sesiones() as db:
+            db.add(Estudiante(
+                nombres="Juan",
+                apellidos="Pérez",
+                correo_institucional=CORREO,
+                dni="12345678",
+                contrasena_hash=contrasena_hash
+            ))
+            await db.commit()
+
+    asyncio.run(crear())
+
+
+def _leer_hash(sesiones) -> str:
+    async def leer():
+        async with sesiones() as db:
+            return await db.scalar(
+                select(Estudiante.contrasena_hash).where(Estudiante.correo_institucional == CORREO)
+            )
+
+    return asyncio.run(leer())
+
+
+def _login(client, contrasena: str):
+    return client.post("/login", json={"correo_institucional": CORREO, "contrasena": contrasena})
+
+
+def test_login_migra_hash_bcrypt_a_argon2(client, sesiones):
+    _crear_estudiante(sesiones, bcrypt.hashpw(CONTRASENA.encode("utf-8"), bcrypt.gensalt()).decode("utf-8"))
+
+    response = _login(client, CONTRASENA)
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    assert _leer_hash(sesiones).startswith("$argon2id$")
+
+    # El segundo login verifica contra el hash argon2 ya migrado
+    assert _login(client, CONTRASENA).status_code == 200
+
+
+def test_login_migra_hash_bcrypt_con_contrasena_larga(client, sesiones):
+    # bcrypt solo usa los primeros 72 bytes; argon2 debe hashear la contraseña completa
+    contrasena = "p" * 80
+    _crear_estudiante(sesiones, bcrypt.hashpw(contrasena.encode("utf-8")[:72], bcrypt.gensalt()).decode("utf-8"))
+
+    assert _login(client, contrasena).status_code == 200
+    assert _leer_hash(sesiones).startswith("$argon2id$")
+    assert _login(client, contrasena).status_code == 200
+
+
+def test_login_contrasena_incorrecta_con_hash_bcrypt(client, sesiones):
+    hash_bcrypt = bcrypt.hashpw(CONTRASENA.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    _crear_estudiante(sesiones, hash_bcrypt)
+
+    response = _login(client, "Incorrecta123")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Correo institucional o contraseña incorrectos"
+    # Un login fallido no migra el hash
+    assert _leer_hash(sesiones) == hash_bcrypt
+
+
+def test_login_contrasena_incorrecta_con_hash_argon2(client, sesiones):
+    _crear_estudiante(sesiones, hash_password(CONTRASENA))
+
+    response = _login(client, "Incorrecta123")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Correo institucional o contraseña incorrectos"
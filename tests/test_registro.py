@@ -0,0 +1,48 @@
+from asyncpg.exceptions import UniqueViolationError
+from sqlalchemy.exc import IntegrityError
+
+from auth import _constraint_name
+
+ESTUDIANTE = {
+    "nombres": "Juan",
+    "apellidos": "Pérez",
+    "correo_institucional": "juan.perez@universidad.edu.pe",
+    "dni": "12345678",
+    "contrasena": "Password123"
+}
+
+
+def test_registro_exitoso(client):
+    response = client.post("/registro", json=ESTUDIANTE)
+    assert response.status_code == 201
+    assert response.json()["correo_institucional"] == ESTUDIANTE["correo_institucional"]
+    assert "contrasena_hash" not in response.json()
+
+
+def test_registro_correo_duplicado_retorna_400(client):
+    assert client.post("/registro", json=ESTUDIANTE).status_code == 201
+
+    response = client.post("/registro", json={**ESTUDIANTE, "dni": "87654321"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "El correo institucional ya está registrado"
+
+
+def test_registro_dni_duplicado_retorna_400(client):
+    assert client.post("/registro", json=ESTUDIANTE).status_code == 201
+
+    response = client.post(
+        "/registro",
+        json={**ESTUDIANTE, "correo_institucional": "otro.estudiante@universidad.edu.pe"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "El DNI ya está registrado"
+
+
+def test_constraint_name_desde_asyncpg():
+    # SQLite no informa la restricción violada; se simula el error que adapta asyncpg
+    causa = UniqueViolationError("llave duplicada viola restricción de unicidad")
+    causa.constraint_name = "ix_estudiantes_dni"
+    orig = Exception("error adaptado")
+    orig.__cause__ = causa
+
+    assert _constraint_name(IntegrityError("INSERT INTO estudiantes ...", {}, orig)) == "ix_estudiantes_dni"
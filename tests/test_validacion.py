@@ -0,0 +1,29 @@
+from fastapi.testclient import TestClient
+
+from auth import app
+
+client = TestClient(app, raise_server_exceptions=False)
+
+
+def test_login_correo_malformado_retorna_422():
+    response = client.post(
+        "/login",
+        json={"correo_institucional": "juan@", "contrasena": "Password123"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "correo_institucional"]
+
+
+def test_registro_dni_invalido_retorna_422():
+    response = client.post(
+        "/registro",
+        json={
+            "nombres": "Juan",
+            "apellidos": "Pérez",
+            "correo_institucional": "juan.perez@universidad.edu.pe",
+            "dni": "12ab5678",
+            "contrasena": "Password123"
+        }
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "dni"]